@@ -7,14 +7,29 @@ between Mem0, Neo4j, and Qdrant.
 
 import os
 import re
+import time
+import asyncio
+import threading
 import httpx
+import orjson
+import msgspec
 import structlog
+try:
+    import hyperscan
+except ImportError:  # no wheels for this platform; RE2 or the regex scan covers it
+    hyperscan = None
+try:
+    import re2
+except ImportError:  # the stdlib regex scan covers it
+    re2 = None
 from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Optional, Union
 from contextlib import asynccontextmanager
+from concurrent.futures import Executor, ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict
 
 # -----------------------------------------------------------------------------
 # Configuration
@@ -24,6 +39,19 @@ MEM0_API_URL = os.getenv("MEM0_API_URL", "http://localhost:8080")
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "recall2024")
+MEM0_POOL_SIZE = int(os.getenv("MEM0_POOL_SIZE", "100"))
+# HTTP/2 is negotiated via TLS ALPN, so it only takes effect for https Mem0 URLs
+MEM0_HTTP2 = os.getenv("MEM0_HTTP2", "false").lower() == "true"
+MEM0_MAX_INFLIGHT = int(os.getenv("MEM0_MAX_INFLIGHT", "8"))
+MEM0_CACHE_TTL = float(os.getenv("MEM0_CACHE_TTL", "30"))
+MEM0_CACHE_SIZE = int(os.getenv("MEM0_CACHE_SIZE", "1024"))
+# Per uvicorn worker; os.cpu_count() reports host CPUs inside containers
+SIGNAL_WORKERS = int(os.getenv("SIGNAL_WORKERS") or 2)
+# Largest /session/end request body accepted, in bytes; checked before buffering
+MAX_TRANSCRIPT = int(os.getenv("MAX_TRANSCRIPT", str(10 * 1024 * 1024)))
+TRANSCRIPT_SAMPLE = int(os.getenv("TRANSCRIPT_SAMPLE", "5000"))
+# Memory bodies above this many characters are streamed to Mem0 in chunks
+MEM0_STREAM_THRESHOLD = int(os.getenv("MEM0_STREAM_THRESHOLD", "100000"))
 SIGNAL_KEYWORDS = os.getenv("SIGNAL_KEYWORDS", "remember,decided,architecture,important").split(",")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -48,18 +76,26 @@ log = structlog.get_logger()
 
 class SessionStart(BaseModel):
     """Request to start a new session and get context injection."""
+    model_config = ConfigDict(frozen=True)
     user_id: str
     project_id: Optional[str] = "default"
     query: Optional[str] = None  # Optional context hint
 
-class SessionEnd(BaseModel):
-    """Request to end a session and capture memories."""
+class SessionEnd(msgspec.Struct, frozen=True, kw_only=True):
+    """
+    Request to end a session and capture memories.
+    A msgspec Struct rather than a Pydantic model: the transcript is by far the
+    largest body the orchestrator receives, so it gets the fastest decoder.
+    """
     user_id: str
     project_id: Optional[str] = "default"
     transcript: str  # Full session transcript
+
+SESSION_END_DECODER = msgspec.json.Decoder(SessionEnd)
     
 class MemoryCapture(BaseModel):
     """Request to immediately capture a memory (signal detection)."""
+    model_config = ConfigDict(frozen=True)
     user_id: str
     project_id: Optional[str] = "default"
     content: str
@@ -67,123 +103,391 @@ class MemoryCapture(BaseModel):
 
 class SearchRequest(BaseModel):
     """Request to search memories."""
+    model_config = ConfigDict(frozen=True)
     query: str
     user_id: Optional[str] = None
     project_id: Optional[str] = None
     limit: int = 10
 
-class HealthResponse(BaseModel):
-    status: str
-    timestamp: str
-    services: dict
-
 # -----------------------------------------------------------------------------
 # Signal Detection
 # -----------------------------------------------------------------------------
 
-def detect_signals(text: str) -> list[str]:
+def normalize_signal_keywords(keywords: list[str]) -> dict[str, str]:
+    """
+    Map each lowercased keyword to its configured spelling, dropping blanks
+    and duplicates while keeping config order.
+    """
+    display = {}
+    for keyword in keywords:
+        if keyword.strip():
+            display.setdefault(keyword.strip().lower(), keyword.strip())
+    return display
+
+# Keywords are fixed at startup, so normalize them once rather than per call
+SIGNAL_DISPLAY = normalize_signal_keywords(SIGNAL_KEYWORDS)
+SIGNAL_NORMALIZED = tuple(SIGNAL_DISPLAY)
+# Keyword id -> configured spelling, for reporting matches
+SIGNAL_NAMES = tuple(SIGNAL_DISPLAY.values())
+# Anything shorter than this cannot contain a signal
+MIN_SIGNAL_LEN = min(map(len, SIGNAL_NORMALIZED), default=0)
+
+def build_signal_pattern(keywords: tuple[str, ...]) -> tuple[re.Pattern, tuple[int, ...]]:
+    """
+    Compile normalized signal keywords into one case-insensitive regex.
+    The alternation sits in a lookahead, longest first, so keywords that
+    overlap at different offsets are all reported. Returns the pattern and
+    the keyword index captured by each group.
+    """
+    order = sorted(range(len(keywords)), key=lambda index: -len(keywords[index]))
+    alternation = "|".join(f"({re.escape(keywords[index])})" for index in order)
+    return re.compile(f"(?=(?:{alternation}))", re.IGNORECASE), tuple(order)
+
+def build_signal_database(keywords: tuple[str, ...]) -> Optional["hyperscan.Database"]:
+    """
+    Compile normalized signal keywords into a caseless Hyperscan block-mode database.
+    Returns None when Hyperscan is unavailable or there is nothing to match.
+    HS_FLAG_CASELESS only folds ASCII, so non-ASCII keywords are also left to
+    RE2 or the regex scan rather than silently missing other casings.
+    """
+    if hyperscan is None or not keywords or not all(keyword.isascii() for keyword in keywords):
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[keyword.encode() for keyword in keywords],
+        ids=list(range(len(keywords))),
+        elements=len(keywords),
+        # Each keyword only needs reporting once
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+        literal=True
+    )
+    return database
+
+def build_signal_set(keywords: tuple[str, ...]) -> tuple[Optional["re2.Set"], tuple]:
+    """
+    Compile normalized signal keywords into a caseless RE2 set, plus one RE2
+    pattern per keyword to locate its first occurrence.
+    Returns (None, ()) when RE2 is unavailable or there is nothing to match.
+    """
+    if re2 is None or not keywords:
+        return None, ()
+    options = re2.Options()
+    options.case_sensitive = False
+    keyword_set = re2.Set.SearchSet(options)
+    for keyword in keywords:
+        keyword_set.Add(re2.escape(keyword))
+    keyword_set.Compile()
+    patterns = tuple(re2.compile(re2.escape(keyword), options) for keyword in keywords)
+    return keyword_set, patterns
+
+SIGNAL_PATTERN, SIGNAL_PATTERN_ORDER = build_signal_pattern(SIGNAL_NORMALIZED)
+# Shorter keywords that are prefixes of a longer one; the lookahead only
+# reports the longer keyword where both start, so these are implied matches.
+# This keeps the regex scan equal to a per-keyword substring check, which is
+# the reference check_signal_backends holds the other backends to.
+SIGNAL_PREFIXES = tuple(
+    tuple(
+        other for other, prefix in enumerate(SIGNAL_NORMALIZED)
+        if other != index and keyword.startswith(prefix)
+    )
+    for index, keyword in enumerate(SIGNAL_NORMALIZED)
+)
+SIGNAL_DATABASE = build_signal_database(SIGNAL_NORMALIZED)
+SIGNAL_SET, SIGNAL_SET_PATTERNS = build_signal_set(SIGNAL_NORMALIZED)
+# Hyperscan scratch space can't be shared by concurrent scans, and detection
+# runs on worker threads, so each thread gets its own
+signal_scratch = threading.local()
+
+def hyperscan_scratch() -> "hyperscan.Scratch":
+    """Return this thread's scratch space for SIGNAL_DATABASE."""
+    if not hasattr(signal_scratch, "space"):
+        signal_scratch.space = hyperscan.Scratch(SIGNAL_DATABASE)
+    return signal_scratch.space
+
+def find_signals(text: str, database: Optional["hyperscan.Database"],
+                 keyword_set: Optional["re2.Set"]) -> list[tuple[int, int, int]]:
+    """
+    Scan text with the given backend: Hyperscan if a database is passed, else
+    RE2 if a set is passed, else lowercase plus str.find.
+    """
+    found = {}
+    if database is not None or keyword_set is not None:
+        data = text.encode("utf-8", "surrogatepass")
+        if database is not None:
+            # Vectorized scan over the raw bytes; caseless matching needs no copy
+            def on_match(index, start, end, flags, context):
+                found[index] = end
+            database.scan(data, match_event_handler=on_match, scratch=hyperscan_scratch())
+        else:
+            # One linear-time DFA pass finds which keywords occur at all;
+            # only those are then located, each stopping at its first hit
+            for index in keyword_set.Match(data) or ():
+                found[index] = SIGNAL_SET_PATTERNS[index].search(data).end()
+        if len(data) != len(text):
+            # Non-ASCII text: map byte offsets back to str offsets in one pass
+            chars, last = 0, 0
+            for index in sorted(found, key=found.get):
+                chars += len(data[last:found[index]].decode("utf-8", "surrogatepass"))
+                last = found[index]
+                found[index] = chars
+    else:
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            # One C-level substring search per keyword; far faster on real
+            # transcripts than a regex attempted at every offset
+            for index, keyword in enumerate(SIGNAL_NORMALIZED):
+                pos = lowered.find(keyword)
+                if pos != -1:
+                    found[index] = pos + len(keyword)
+        else:
+            # Lowercasing changed the length (e.g. "İ"), so its offsets
+            # wouldn't line up with text; fall back to the regex scan
+            found = regex_signal_ends(text)
+    return signal_spans(found)
+
+def regex_signal_ends(text: str) -> dict[int, int]:
+    """
+    Map keyword id -> end of its first occurrence using the lookahead regex.
+    Slow on long inputs, so it serves as the parity reference and the rare
+    length-changing-lowercase fallback.
+    """
+    found = {}
+    for match in SIGNAL_PATTERN.finditer(text):
+        index = SIGNAL_PATTERN_ORDER[match.lastindex - 1]
+        if index in found:
+            continue
+        found[index] = match.end(match.lastindex)
+        for prefix in SIGNAL_PREFIXES[index]:
+            found.setdefault(prefix, match.start() + len(SIGNAL_NORMALIZED[prefix]))
+        if len(found) == len(SIGNAL_NORMALIZED):
+            break
+    return found
+
+def signal_spans(found: dict[int, int]) -> list[tuple[int, int, int]]:
+    """Turn keyword id -> end offset into (start, end, keyword id), in config order."""
+    return [
+        (found[index] - len(SIGNAL_NORMALIZED[index]), found[index], index)
+        for index in sorted(found)
+    ]
+
+def check_signal_backends():
+    """
+    Parity check run at startup: scan a probe built from the keywords in
+    several casings with each backend and compare against the lookahead
+    regex reference. A native backend that disagrees is disabled so results
+    never depend on which wheels happen to be installed; the str.find
+    fallback has nothing to fall back to, so a mismatch there is only logged.
+    """
+    global SIGNAL_DATABASE, SIGNAL_SET
+    if not SIGNAL_NORMALIZED:
+        return
+    probe = " | ".join(
+        variant
+        for keyword in SIGNAL_DISPLAY.values()
+        for variant in (keyword, keyword.upper(), keyword.title(), keyword.swapcase())
+    )
+    expected = signal_spans(regex_signal_ends(probe))
+    if find_signals(probe, None, None) != expected:
+        log.warning("signal_backend_mismatch", backend="str.find")
+    if SIGNAL_DATABASE is not None and find_signals(probe, SIGNAL_DATABASE, None) != expected:
+        log.warning("signal_backend_mismatch", backend="hyperscan")
+        SIGNAL_DATABASE = None
+    if SIGNAL_SET is not None and find_signals(probe, None, SIGNAL_SET) != expected:
+        log.warning("signal_backend_mismatch", backend="re2")
+        SIGNAL_SET = None
+
+def detect_signals(text: str) -> list[tuple[int, int, int]]:
     """
     Detect signal keywords in text that should trigger immediate memory capture.
-    Returns list of matched signals.
+    Returns (start, end, keyword id) for the first occurrence of each matched
+    signal; SIGNAL_NAMES maps the id back to the keyword.
     """
-    signals = []
-    text_lower = text.lower()
-    for keyword in SIGNAL_KEYWORDS:
-        if keyword.strip().lower() in text_lower:
-            signals.append(keyword.strip())
-    return signals
+    if not SIGNAL_NORMALIZED:
+        return []
+    return find_signals(text, SIGNAL_DATABASE, SIGNAL_SET)
+
+check_signal_backends()
 
-def extract_signal_context(text: str, signal: str, window: int = 200) -> str:
+def build_signal_pool() -> Executor:
     """
-    Extract context around a signal keyword for memory storage.
+    Create the thread pool that runs detect_signals off the event loop.
+    Hyperscan and RE2 release the GIL while scanning; the str.find fallback
+    holds it only for short C-level searches. Threads also avoid pickling the
+    transcript and forking inside the running event loop.
     """
-    text_lower = text.lower()
-    pos = text_lower.find(signal.lower())
-    if pos == -1:
-        return text[:window]
-    
-    start = max(0, pos - window // 2)
-    end = min(len(text), pos + len(signal) + window // 2)
-    return text[start:end].strip()
+    return ThreadPoolExecutor(max_workers=SIGNAL_WORKERS, thread_name_prefix="signals")
+
+def extract_signal_context(text: str, start: int, end: int, window: int = 200) -> str:
+    """
+    Extract context around a signal keyword spanning text[start:end] for memory storage.
+    """
+    return text[max(0, start - window // 2):min(len(text), end + window // 2)].strip()
 
 # -----------------------------------------------------------------------------
 # Mem0 Client
 # -----------------------------------------------------------------------------
 
-async def mem0_add(content: str, user_id: str, project_id: str, metadata: dict = None):
-    """Add a memory to Mem0."""
-    async with httpx.AsyncClient() as client:
-        payload = {
+# Caps concurrent memory writes (each runs an LLM extraction in Mem0) so
+# session-end fanouts don't overrun it. Reads are deliberately not gated,
+# so session starts and searches never queue behind slow writes.
+mem0_write_slots = asyncio.Semaphore(MEM0_MAX_INFLIGHT)
+
+def mem0_client() -> httpx.AsyncClient:
+    """Shared Mem0 client, opened once in the app lifespan."""
+    return app.state.mem0_client
+
+async def iter_memory_json(content: str, user_id: str, metadata: dict,
+                           chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    """
+    Yield a memory-add JSON body piecewise, escaping content one chunk at a time
+    so a large transcript is never encoded into a single buffer.
+    """
+    yield b'{"messages":[{"role":"user","content":"'
+    for offset in range(0, len(content), chunk_size):
+        yield orjson.dumps(content[offset:offset + chunk_size])[1:-1]
+    yield b'"}],"user_id":' + orjson.dumps(user_id) + b',"metadata":' + orjson.dumps(metadata) + b'}'
+
+async def mem0_post(path: str, body: Union[bytes, AsyncIterator[bytes]]) -> httpx.Response:
+    """POST a pre-encoded (or streamed) JSON body to Mem0."""
+    response = await mem0_client().post(
+        path,
+        content=body,
+        headers={"Content-Type": "application/json"}
+    )
+    response.raise_for_status()
+    return response
+
+async def mem0_add(content: str, user_id: str, project_id: str, metadata: dict = None,
+                   captured_at: str = None):
+    """Add a memory to Mem0. Fanouts pass one captured_at for the whole batch."""
+    metadata = {
+        "project_id": project_id,
+        "captured_at": captured_at or datetime.now(timezone.utc).isoformat(),
+        **(metadata or {})
+    }
+    if len(content) > MEM0_STREAM_THRESHOLD:
+        body = iter_memory_json(content, user_id, metadata)
+    else:
+        body = orjson.dumps({
             "messages": [{"role": "user", "content": content}],
             "user_id": user_id,
-            "metadata": {
-                "project_id": project_id,
-                "captured_at": datetime.now(timezone.utc).isoformat(),
-                **(metadata or {})
-            }
-        }
-        response = await client.post(f"{MEM0_API_URL}/v1/memories/", json=payload)
-        response.raise_for_status()
-        return response.json()
+            "metadata": metadata
+        })
+    async with mem0_write_slots:
+        response = await mem0_post("/v1/memories/", body)
+    # Keep read-after-write for this user's next session start
+    mem0_get_all_cache.pop(user_id, None)
+    return response.json()
+
+async def mem0_search_raw(query: str, user_id: str = None, project_id: str = None,
+                          limit: int = 10) -> httpx.Response:
+    """Search memories in Mem0, returning the undecoded response."""
+    params = {"query": query, "limit": limit}
+    if user_id:
+        params["user_id"] = user_id
+    if project_id:
+        params["filters"] = {"project_id": project_id}
+    
+    return await mem0_post("/v1/memories/search/", orjson.dumps(params))
 
 async def mem0_search(query: str, user_id: str = None, project_id: str = None, limit: int = 10):
     """Search memories in Mem0."""
-    async with httpx.AsyncClient() as client:
-        params = {"query": query, "limit": limit}
-        if user_id:
-            params["user_id"] = user_id
-        if project_id:
-            params["filters"] = {"project_id": project_id}
-        
-        response = await client.post(f"{MEM0_API_URL}/v1/memories/search/", json=params)
-        response.raise_for_status()
-        return response.json()
+    response = await mem0_search_raw(query, user_id=user_id, project_id=project_id, limit=limit)
+    return response.json()
+
+# user_id -> (expires at, fetch task). Mem0 is only filtered by user here,
+# so project_id is not part of the key. Sharing the task means concurrent
+# session starts for the same user make a single request.
+mem0_get_all_cache: dict[str, tuple[float, asyncio.Task]] = {}
+
+async def fetch_all_memories(user_id: str):
+    """Fetch all memories for a user from Mem0, bypassing the cache."""
+    params = {"user_id": user_id}
+    response = await mem0_client().get("/v1/memories/", params=params)
+    response.raise_for_status()
+    return response.json()
 
 async def mem0_get_all(user_id: str, project_id: str = None):
-    """Get all memories for a user."""
-    async with httpx.AsyncClient() as client:
-        params = {"user_id": user_id}
-        response = await client.get(f"{MEM0_API_URL}/v1/memories/", params=params)
-        response.raise_for_status()
-        return response.json()
+    """Get all memories for a user, cached for MEM0_CACHE_TTL seconds."""
+    now = time.monotonic()
+    cached = mem0_get_all_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        task = cached[1]
+    else:
+        task = asyncio.ensure_future(fetch_all_memories(user_id))
+        mem0_get_all_cache.pop(user_id, None)
+        if len(mem0_get_all_cache) >= MEM0_CACHE_SIZE:
+            # Dicts keep insertion order, so the first entry is the oldest
+            mem0_get_all_cache.pop(next(iter(mem0_get_all_cache)))
+        mem0_get_all_cache[user_id] = (now + MEM0_CACHE_TTL, task)
+    
+    try:
+        # Shielded so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+    except Exception:
+        # Don't serve a failure from cache
+        if mem0_get_all_cache.get(user_id, (0, None))[1] is task:
+            del mem0_get_all_cache[user_id]
+        raise
 
 # -----------------------------------------------------------------------------
 # Application
 # -----------------------------------------------------------------------------
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     log.info("recall_orchestrator_starting", keywords=SIGNAL_KEYWORDS)
+    # One pooled client for the process lifetime so Mem0 calls reuse
+    # keep-alive connections instead of reconnecting per request
+    app.state.mem0_client = httpx.AsyncClient(
+        base_url=MEM0_API_URL,
+        limits=httpx.Limits(
+            max_connections=MEM0_POOL_SIZE,
+            max_keepalive_connections=MEM0_POOL_SIZE
+        ),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        http2=MEM0_HTTP2
+    )
+    app.state.signal_pool = build_signal_pool()
     yield
+    await app.state.mem0_client.aclose()
+    app.state.signal_pool.shutdown(cancel_futures=True)
     log.info("recall_orchestrator_stopping")
 
 app = FastAPI(
     title="Project Recall - Orchestrator",
     description="Memory orchestration for Claude Code sessions",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", response_model=None)
 async def health_check():
     """Check health of orchestrator and connected services."""
     services = {"orchestrator": "healthy"}
     
     # Check Mem0
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            r = await client.get(f"{MEM0_API_URL}/health")
-            services["mem0"] = "healthy" if r.status_code == 200 else "unhealthy"
+        r = await mem0_client().get("/health", timeout=5.0)
+        services["mem0"] = "healthy" if r.status_code == 200 else "unhealthy"
+        log.debug("mem0_health", http_version=r.http_version)
     except Exception:
         services["mem0"] = "unreachable"
     
     overall = "healthy" if all(v == "healthy" for v in services.values()) else "degraded"
     
-    return HealthResponse(
-        status=overall,
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        services=services
-    )
+    # Polled often and fixed in shape, so skip response validation/encoding
+    return ORJSONResponse({
+        "status": overall,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "services": services
+    })
 
 @app.post("/session/start")
 async def session_start(req: SessionStart):
@@ -195,18 +499,26 @@ async def session_start(req: SessionStart):
     log.info("session_start", user_id=req.user_id, project_id=req.project_id)
     
     try:
-        # Get recent memories for this user + project
-        memories = await mem0_get_all(req.user_id, req.project_id)
-        
-        # If there's a specific query/context hint, search for relevant memories
-        relevant = []
+        # Recent memories and the optional query search are independent,
+        # so fetch them concurrently rather than back to back
+        tasks = [mem0_get_all(req.user_id, req.project_id)]
         if req.query:
-            search_results = await mem0_search(
+            tasks.append(mem0_search(
                 req.query, 
                 user_id=req.user_id, 
                 project_id=req.project_id,
                 limit=5
-            )
+            ))
+        memories, *maybe_search = await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(memories, BaseException):
+            raise memories
+        
+        # A failed search only costs the relevant memories, not the session
+        relevant = []
+        for search_results in maybe_search:
+            if isinstance(search_results, BaseException):
+                log.warning("session_start_search_failed", error=str(search_results))
+                continue
             relevant = search_results.get("results", [])
         
         return {
@@ -223,47 +535,106 @@ async def session_start(req: SessionStart):
         log.error("session_start_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+async def read_body_capped(raw: Request, limit: int) -> bytearray:
+    """
+    Read a request body, refusing with 413 as soon as it exceeds `limit` bytes,
+    so an oversized upload is never fully buffered.
+    """
+    length = raw.headers.get("content-length", "")
+    if length.isdigit() and int(length) > limit:
+        raise HTTPException(status_code=413, detail=f"Request body exceeds {limit} bytes")
+    body = bytearray()
+    async for chunk in raw.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(status_code=413, detail=f"Request body exceeds {limit} bytes")
+    return body
+
 @app.post("/session/end")
-async def session_end(req: SessionEnd):
+async def session_end(raw: Request):
     """
     Called at session end. Extracts and stores memories from transcript.
     
     This is the "auto-capture" pattern from Supermemory.
     """
+    try:
+        req = SESSION_END_DECODER.decode(await read_body_capped(raw, MAX_TRANSCRIPT))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
     log.info("session_end", user_id=req.user_id, project_id=req.project_id, 
              transcript_length=len(req.transcript))
     
     try:
-        # Detect any signal keywords in the transcript
-        signals = detect_signals(req.transcript)
-        captured = []
+        # Detect any signal keywords in the transcript, unless it is too
+        # short to hold even the shortest one (e.g. keep-alive sessions)
+        matches = []
+        if len(req.transcript) >= MIN_SIGNAL_LEN:
+            # Scanning a large transcript is CPU-bound; the worker pool keeps
+            # the event loop free for concurrent session starts
+            matches = await asyncio.get_running_loop().run_in_executor(
+                app.state.signal_pool, detect_signals, req.transcript
+            )
+        signals = [SIGNAL_NAMES[index] for _, _, index in matches]
+        captured_at = datetime.now(timezone.utc).isoformat()
         
-        # For each signal, extract context and store
-        for signal in signals:
-            context = extract_signal_context(req.transcript, signal)
-            result = await mem0_add(
-                content=context,
+        # For each signal, slice its context straight from the match span
+        coros = [
+            mem0_add(
+                content=extract_signal_context(req.transcript, start, end),
                 user_id=req.user_id,
                 project_id=req.project_id,
-                metadata={"signal": signal, "source": "auto-capture"}
+                metadata={"signal": signal, "source": "auto-capture"},
+                captured_at=captured_at
             )
-            captured.append({"signal": signal, "memory_id": result.get("id")})
-            log.info("memory_captured", signal=signal, user_id=req.user_id)
+            for signal, (start, end, _) in zip(signals, matches)
+        ]
         
         # Also send full transcript to Mem0 for general fact extraction
         # (Mem0 will deduplicate and extract atomic facts)
-        if len(req.transcript) > 100:  # Only if substantial content
-            await mem0_add(
-                content=f"Session transcript:\n{req.transcript[:5000]}",  # Limit size
+        # Only if substantial content
+        if len(req.transcript) > 100 and not req.transcript.isspace():
+            coros.append(mem0_add(
+                content=f"Session transcript:\n{req.transcript[:TRANSCRIPT_SAMPLE]}",  # Limit size
                 user_id=req.user_id,
                 project_id=req.project_id,
-                metadata={"source": "session-end", "full_transcript": True}
-            )
+                metadata={"source": "session-end", "full_transcript": True},
+                captured_at=captured_at
+            ))
+        
+        transcript = "skipped" if len(coros) == len(signals) else "captured"
+        if not coros:
+            return {"status": "ok", "signals_detected": [], "memories_captured": [],
+                    "transcript": transcript}
+        
+        # The writes are independent; fire them together and let the
+        # write limit in mem0_add pace them
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        
+        captured = []
+        errors = []
+        for signal, result in zip(signals, results):
+            if isinstance(result, BaseException):
+                log.error("memory_capture_failed", signal=signal, error=str(result))
+                errors.append(result)
+                continue
+            captured.append({"signal": signal, "memory_id": result.get("id")})
+            log.info("memory_captured", signal=signal, user_id=req.user_id)
+        for result in results[len(signals):]:
+            if isinstance(result, BaseException):
+                log.error("transcript_capture_failed", error=str(result))
+                errors.append(result)
+                transcript = "failed"
+        
+        # Nothing was stored at all; report it as the failure it is
+        if len(errors) == len(results):
+            raise errors[0]
         
         return {
-            "status": "ok",
+            "status": "partial" if errors else "ok",
             "signals_detected": signals,
-            "memories_captured": captured
+            "memories_captured": captured,
+            "transcript": transcript
         }
     except Exception as e:
         log.error("session_end_failed", error=str(e))
@@ -288,7 +659,7 @@ async def memory_capture(req: MemoryCapture):
         log.error("memory_capture_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/memory/search")
+@app.post("/memory/search", response_model=None)
 async def memory_search(req: SearchRequest):
     """
     Search memories with triple hybrid retrieval.
@@ -296,17 +667,25 @@ async def memory_search(req: SearchRequest):
     log.info("memory_search", query=req.query[:50], user_id=req.user_id)
     
     try:
-        results = await mem0_search(
+        response = await mem0_search_raw(
             query=req.query,
             user_id=req.user_id,
             project_id=req.project_id,
             limit=req.limit
         )
-        return results
+        # Mem0's JSON bytes are forwarded unchanged, never decoded or re-encoded
+        return Response(content=response.content, media_type="application/json")
     except Exception as e:
         log.error("memory_search_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )